@@ -1,7 +1,67 @@
 import pygame
+import functools
 import json
 import os
 
+# Отладочные сообщения о загрузке и добавлении анимаций (PYGAME_ANIMATOR_DEBUG=1)
+# Ошибки печатаются всегда
+DEBUG = os.environ.get('PYGAME_ANIMATOR_DEBUG', '0') != '0'
+
+# Длительность одного кадра игры при 60 FPS (мс)
+# speed анимации задаётся в таких кадрах, а отсчитывается по реальному времени
+_FRAME_TIME_MS = 1000 / 60
+
+# Кэш загруженных изображений: путь -> pygame.Surface
+# Один и тот же файл декодируется с диска только один раз
+_IMAGE_CACHE = {}
+
+# Кэш нарезанных кадров: (лист, позиции кадров, ширина, высота) -> кадры
+# Персонажи с одинаковыми анимациями на одном листе используют общие поверхности.
+# Здесь только немасштабированные кадры листов из _IMAGE_CACHE: масштабированные
+# копии хранит сама анимация, и при смене масштаба старые просто освобождаются
+_FRAMES_CACHE = {}
+
+
+def _load_image(path):
+    """
+    Загружаем изображение через кэш (общая поверхность для всех персонажей)
+    """
+    path = os.path.abspath(path)
+    image = _IMAGE_CACHE.get(path)
+    if image is None:
+        image = pygame.image.load(path)
+        try:
+            # Приводим к формату экрана - дальше все blit идут по быстрому пути
+            image = image.convert_alpha()
+        except pygame.error:
+            # Окно ещё не создано (pygame.display.set_mode) - не кэшируем,
+            # чтобы после создания окна загрузить уже сконвертированную версию
+            return image
+        _IMAGE_CACHE[path] = image
+    return image
+
+
+@functools.lru_cache(maxsize=256)
+def _grid_frame_positions(first_index, frames, columns, frame_width, frame_height):
+    """
+    Пиксельные координаты кадров, идущих подряд в сетке спрайт-листа
+    first_index - номер первого кадра (с 0), кадры идут слева направо, сверху вниз
+    Результат кэшируется: персонажи с одинаковыми анимациями считают его один раз
+    """
+    return tuple(
+        ((index % columns) * frame_width, (index // columns) * frame_height)
+        for index in range(first_index, first_index + frames)
+    )
+
+
+def clear_image_cache():
+    """
+    Очищаем кэш изображений и нарезанных кадров (например, при смене уровня или в тестах)
+    """
+    _IMAGE_CACHE.clear()
+    _FRAMES_CACHE.clear()
+
+
 class AnimatedCharacter(pygame.sprite.Sprite):
     """
     Универсальный класс для создания анимированных персонажей
@@ -22,6 +82,18 @@ class AnimatedCharacter(pygame.sprite.Sprite):
     SEPARATE_DIRECTIONS = "separate_directions"  
     NO_FLIP = "no_flip"
     
+    # Атрибуты хранятся в слотах, а не в __dict__ каждого персонажа:
+    # меньше памяти на спрайт и быстрее доступ к ним в update()
+    # (__dict__ остаётся от pygame.sprite.Sprite, поэтому свои атрибуты в наследниках добавлять можно)
+    __slots__ = (
+        'x', 'y', 'scale', 'direction_mode',
+        'animations', 'current_animation', 'current_frame', '_animation_speed',
+        '_speed_ms', '_frame_count', '_loop', '_next_frame_time',
+        'facing_right', 'current_frame_width', 'current_frame_height',
+        'master_sprite_sheet', 'master_frame_width', 'master_frame_height', 'master_columns', 'next_frame_index',
+        'image', 'rect', '_frames',
+    )
+    
     def __init__(self, x=0, y=0, scale=1.0, direction_mode=AUTO_FLIP):
         """
         Создаем нового персонажа
@@ -44,8 +116,13 @@ class AnimatedCharacter(pygame.sprite.Sprite):
         self.animations = {}
         self.current_animation = None
         self.current_frame = 0
-        self.animation_timer = 0
-        self.animation_speed = 10
+        
+        # Параметры смены кадров текущей анимации (копия из словаря анимации)
+        self._animation_speed = 10
+        self._speed_ms = 10 * _FRAME_TIME_MS
+        self._frame_count = 1
+        self._loop = True
+        self._next_frame_time = float('inf')  # Когда сменить кадр (мс, pygame.time.get_ticks)
         
         # Направление персонажа
         self.facing_right = True
@@ -62,11 +139,30 @@ class AnimatedCharacter(pygame.sprite.Sprite):
         self.next_frame_index = 0  # Следующий свободный кадр в большом спрайт-листе
         
         # ВАЖНО: Атрибуты для pygame.sprite.Sprite
+        # image - общий кадр из кэша (часто подповерхность спрайт-листа), его же
+        # показывают все персонажи с этой анимацией. Только для чтения: чтобы
+        # перекрасить или сделать прозрачным (вспышка, затухание), сначала image.copy()
         self.image = pygame.Surface((self.current_frame_width, self.current_frame_height), pygame.SRCALPHA)
         self.rect = pygame.Rect(x, y, self.current_frame_width, self.current_frame_height)
         
         # Дополнительные атрибуты для удобства
-        self._original_image = None  # Храним оригинальное изображение для поворотов/масштабирования
+        self._frames = None  # Готовые кадры текущей анимации (с учётом масштаба и направления)
+    
+    @property
+    def animation_speed(self):
+        """
+        Скорость текущей анимации (сколько кадров игры при 60 FPS длится один кадр анимации)
+        """
+        return self._animation_speed
+    
+    @animation_speed.setter
+    def animation_speed(self, speed):
+        # Меняем скорость играющей анимации - пересчитываем длительность кадра в мс
+        # и сдвигаем срок уже ожидаемой смены кадра под новую скорость
+        speed_ms = speed * _FRAME_TIME_MS
+        self._next_frame_time += speed_ms - self._speed_ms
+        self._animation_speed = speed
+        self._speed_ms = speed_ms
     
     def set_direction_mode(self, mode):
         """
@@ -75,7 +171,9 @@ class AnimatedCharacter(pygame.sprite.Sprite):
         """
         if mode in [self.AUTO_FLIP, self.SEPARATE_DIRECTIONS, self.NO_FLIP]:
             self.direction_mode = mode
-            print(f"🔄 Режим направлений изменен на: {mode}")
+            self._select_frames()
+            if DEBUG:
+                print(f"🔄 Режим направлений изменен на: {mode}")
         else:
             print(f"❌ Неизвестный режим направлений: {mode}")
     
@@ -84,7 +182,17 @@ class AnimatedCharacter(pygame.sprite.Sprite):
         Устанавливаем направление персонажа вручную
         facing_right - True для правого направления, False для левого
         """
-        self.facing_right = facing_right
+        if self.facing_right != facing_right:
+            self.facing_right = facing_right
+            self._select_frames()
+    
+    def set_scale(self, scale):
+        """
+        Меняем масштаб персонажа во время игры
+        scale - новый размер (1.0 = обычный, 2.0 = в два раза больше)
+        """
+        self.scale = scale
+        self._update_sprite_attributes()
     
     def load_master_sprite_sheet(self, sprite_file, frame_width=64, frame_height=64, columns=8):
         """
@@ -94,12 +202,13 @@ class AnimatedCharacter(pygame.sprite.Sprite):
         columns - сколько кадров в одной строке
         """
         try:
-            self.master_sprite_sheet = pygame.image.load(sprite_file)
+            self.master_sprite_sheet = _load_image(sprite_file)
             self.master_frame_width = frame_width
             self.master_frame_height = frame_height
             self.master_columns = columns
             self.next_frame_index = 0
-            print(f"✅ Загружен мастер спрайт-лист: {sprite_file} ({frame_width}x{frame_height}, {columns} колонок)")
+            if DEBUG:
+                print(f"✅ Загружен мастер спрайт-лист: {sprite_file} ({frame_width}x{frame_height}, {columns} колонок)")
             return True
         except Exception as e:
             print(f"❌ Не удалось загрузить мастер спрайт-лист: {sprite_file}")
@@ -121,19 +230,8 @@ class AnimatedCharacter(pygame.sprite.Sprite):
             return False
         
         # Вычисляем позиции кадров
-        frame_positions = []
-        for i in range(frames):
-            current_index = self.next_frame_index + i
-            
-            # Вычисляем строку и колонку
-            row = current_index // self.master_columns
-            col = current_index % self.master_columns
-            
-            # Вычисляем пиксельные координаты
-            x = col * self.master_frame_width
-            y = row * self.master_frame_height
-            
-            frame_positions.append((x, y))
+        frame_positions = _grid_frame_positions(self.next_frame_index, frames, self.master_columns,
+                                                self.master_frame_width, self.master_frame_height)
         
         self.animations[name] = {
             'mode': 'master',
@@ -142,26 +240,25 @@ class AnimatedCharacter(pygame.sprite.Sprite):
             'frame_height': self.master_frame_height,
             'frames': frames,
             'speed': speed,
+            'speed_ms': speed * _FRAME_TIME_MS,
             'loop': loop,
             'finished': False,
             'frame_positions': frame_positions
         }
+        self._build_frame_cache(self.animations[name])
         
         # Сдвигаем указатель на следующие свободные кадры
         self.next_frame_index += frames
         
         # Если это первая анимация, делаем её текущей
         if self.current_animation is None:
-            self.current_animation = name
-            self.animation_speed = speed
-            self.current_frame_width = self.master_frame_width
-            self.current_frame_height = self.master_frame_height
-            self._update_sprite_attributes()
+            self._set_current_animation(name)
         
-        print(f"✅ Добавлена анимация из мастер-листа: {name} ({frames} кадров)")
+        if DEBUG:
+            print(f"✅ Добавлена анимация из мастер-листа: {name} ({frames} кадров)")
         return True
     
-    def add_animation(self, name, sprite_file, frame_width=64, frame_height=64, frames=4, speed=10, loop=True):
+    def add_animation(self, name, sprite_file, frame_width=64, frame_height=64, frames=4, speed=10, loop=True, lazy=False):
         """
         Добавляем анимацию с ОТДЕЛЬНЫМ спрайт-листом
         name - имя анимации (например, "walk", "jump", "idle")
@@ -170,31 +267,39 @@ class AnimatedCharacter(pygame.sprite.Sprite):
         frames - количество кадров в анимации
         speed - скорость анимации (больше = медленнее)
         loop - повторять ли анимацию
+        lazy - загрузить файл только при первом запуске анимации (или через preload)
         """
+        # Первая анимация сразу становится текущей - её грузим в любом случае
+        if self.current_animation is None:
+            lazy = False
+        
         try:
-            # Загружаем спрайт-лист для этой анимации
-            sprite_image = pygame.image.load(sprite_file)
+            # Загружаем спрайт-лист для этой анимации (или откладываем загрузку)
+            sprite_image = None if lazy else _load_image(sprite_file)
             
             self.animations[name] = {
                 'mode': 'separate',
                 'sprite_image': sprite_image,
+                'sprite_path': sprite_file,
                 'frame_width': frame_width,
                 'frame_height': frame_height,
                 'frames': frames,
                 'speed': speed,
+                'speed_ms': speed * _FRAME_TIME_MS,
                 'loop': loop,
-                'finished': False
+                'finished': False,
+                # Кадры идут слева направо в одной строке
+                'frame_positions': tuple((i * frame_width, 0) for i in range(frames))
             }
+            if not lazy:
+                self._build_frame_cache(self.animations[name])
             
             # Если это первая анимация, делаем её текущей
             if self.current_animation is None:
-                self.current_animation = name
-                self.animation_speed = speed
-                self.current_frame_width = frame_width
-                self.current_frame_height = frame_height
-                self._update_sprite_attributes()
+                self._set_current_animation(name)
             
-            print(f"✅ Загружена отдельная анимация: {name} ({frame_width}x{frame_height}, {frames} кадров)")
+            if DEBUG:
+                print(f"✅ Загружена отдельная анимация: {name} ({frame_width}x{frame_height}, {frames} кадров)")
             return True
             
         except Exception as e:
@@ -202,24 +307,54 @@ class AnimatedCharacter(pygame.sprite.Sprite):
             print(f"   Ошибка: {e}")
             return False
     
-    def add_directional_animation(self, base_name, left_sprite, right_sprite, frame_width=64, frame_height=64, frames=4, speed=10, loop=True):
+    def add_directional_animation(self, base_name, left_sprite, right_sprite, frame_width=64, frame_height=64, frames=4, speed=10, loop=True, lazy=False):
         """
         Добавляем анимацию с ОТДЕЛЬНЫМИ спрайтами для левого и правого направлений
         base_name - базовое имя анимации (например, "walk")
         left_sprite - спрайт для движения влево
         right_sprite - спрайт для движения вправо
+        lazy - загрузить файлы только при первом запуске анимации
         """
         # Добавляем анимации с суффиксами направлений
-        left_success = self.add_animation(f"{base_name}_left", left_sprite, frame_width, frame_height, frames, speed, loop)
-        right_success = self.add_animation(f"{base_name}_right", right_sprite, frame_width, frame_height, frames, speed, loop)
+        left_success = self.add_animation(f"{base_name}_left", left_sprite, frame_width, frame_height, frames, speed, loop, lazy)
+        right_success = self.add_animation(f"{base_name}_right", right_sprite, frame_width, frame_height, frames, speed, loop, lazy)
         
         if left_success and right_success:
-            print(f"✅ Добавлена направленная анимация: {base_name} (лево/право)")
+            if DEBUG:
+                print(f"✅ Добавлена направленная анимация: {base_name} (лево/право)")
             return True
         else:
             print(f"❌ Не удалось добавить направленную анимацию: {base_name}")
             return False
     
+    def preload(self, name):
+        """
+        Заранее загружаем анимацию, добавленную с lazy=True
+        Удобно вызвать перед уровнем, чтобы не было задержки при первом запуске
+        """
+        if name not in self.animations:
+            print(f"❌ Анимация {name} не найдена")
+            return False
+        return self._ensure_loaded(name)
+    
+    def _ensure_loaded(self, name):
+        """
+        Загружаем спрайт-лист и нарезаем кадры, если анимация ещё не загружена
+        """
+        animation = self.animations[name]
+        if 'frames_cache' in animation:
+            return True
+        
+        try:
+            animation['sprite_image'] = _load_image(animation['sprite_path'])
+        except Exception as e:
+            print(f"❌ Не удалось загрузить анимацию {name}: {animation['sprite_path']}")
+            print(f"   Ошибка: {e}")
+            return False
+        
+        self._build_frame_cache(animation)
+        return True
+    
     def _update_sprite_attributes(self):
         """
         Обновляем атрибуты pygame.sprite.Sprite (image и rect)
@@ -228,16 +363,17 @@ class AnimatedCharacter(pygame.sprite.Sprite):
         scaled_width = int(self.current_frame_width * self.scale)
         scaled_height = int(self.current_frame_height * self.scale)
         
-        self.image = pygame.Surface((scaled_width, scaled_height), pygame.SRCALPHA)
-        
-        # Обновляем rect, сохраняя позицию
-        old_center = self.rect.center if hasattr(self, 'rect') else (self.x, self.y)
-        self.rect = pygame.Rect(0, 0, scaled_width, scaled_height)
+        # Обновляем rect на месте (тот же объект), сохраняя позицию
+        old_center = self.rect.center
+        self.rect.size = (scaled_width, scaled_height)
         self.rect.center = old_center
         
         # Синхронизируем x, y с rect
         self.x = self.rect.x
         self.y = self.rect.y
+        
+        # Выбираем готовые кадры под новые размеры
+        self._select_frames()
     
     def play_animation(self, name, reset=True):
         """
@@ -245,110 +381,197 @@ class AnimatedCharacter(pygame.sprite.Sprite):
         name - имя анимации
         reset - начать с первого кадра
         """
+        animations = self.animations
+        
         # Если используем режим отдельных направлений, выбираем правильную анимацию
         if self.direction_mode == self.SEPARATE_DIRECTIONS:
             direction_suffix = "_right" if self.facing_right else "_left"
             
             # Проверяем, есть ли анимация с направлением
             directional_name = f"{name}{direction_suffix}"
-            if directional_name in self.animations:
+            if directional_name in animations:
                 name = directional_name
-            elif name in self.animations:
-                # Если нет направленной анимации, используем базовую
-                pass
-            else:
+            elif name not in animations:
+                # Нет ни направленной, ни базовой анимации
                 print(f"❌ Анимация {name} не найдена")
                 return
+        elif name not in animations:
+            return
+        
+        # Эта анимация уже идёт, а перезапуск не нужен
+        if self.current_animation == name and not reset:
+            return
         
-        if name in self.animations:
-            if self.current_animation != name or reset:
-                self.current_animation = name
-                self.current_frame = 0
-                self.animation_timer = 0
-                
-                # Обновляем параметры текущей анимации
-                animation = self.animations[name]
-                self.animation_speed = animation['speed']
-                self.current_frame_width = animation['frame_width']
-                self.current_frame_height = animation['frame_height']
-                animation['finished'] = False
-                
-                # Обновляем атрибуты спрайта
-                self._update_sprite_attributes()
+        # Отложенная (lazy) анимация загружается при первом запуске
+        if not self._ensure_loaded(name):
+            return
+        
+        self._set_current_animation(name)
+    
+    def _set_current_animation(self, name):
+        """
+        Делаем анимацию текущей и начинаем её с первого кадра
+        Параметры смены кадров копируются в плоские атрибуты персонажа,
+        чтобы update() не искал их в словаре анимаций каждый кадр
+        """
+        animation = self.animations[name]
+        self.current_animation = name
+        self.current_frame = 0
+        
+        # Обновляем параметры текущей анимации
+        self._animation_speed = animation['speed']
+        self._speed_ms = animation['speed_ms']
+        self._frame_count = animation['frames']
+        self._loop = animation['loop']
+        self._next_frame_time = pygame.time.get_ticks() + self._speed_ms
+        self.current_frame_width = animation['frame_width']
+        self.current_frame_height = animation['frame_height']
+        animation['finished'] = False
+        
+        # Обновляем атрибуты спрайта
+        self._update_sprite_attributes()
     
     def update(self):
         """
         Обновляем анимацию (вызывать каждый кадр игры)
         Совместимо с pygame.sprite.Group.update()!
         """
-        if self.current_animation is None:
-            return
+        # Время сменить кадр? Если нет - больше ничего делать не нужно
+        # (пока анимации нет, _next_frame_time бесконечно далеко)
+        # get_ticks() округляет вниз, поэтому срок наступил уже в его миллисекунду
+        now = pygame.time.get_ticks()
+        if now + 1 > self._next_frame_time:
+            self._advance_frame(now)
+    
+    def _advance_frame(self, now):
+        """
+        Переходим к следующему кадру (когда пришло время смены кадра)
+        now - текущее время в мс (pygame.time.get_ticks)
+        """
+        # Отсчитываем от прошлого срока, а не от момента проверки -
+        # иначе каждый кадр затягивается до следующего тика и анимация отстаёт
+        next_frame_time = self._next_frame_time + self._speed_ms
+        if now + 1 > next_frame_time:
+            # Долгая пауза (окно перетаскивали и т.п.) - не догоняем пропущенные кадры
+            next_frame_time = now + self._speed_ms
+        self._next_frame_time = next_frame_time
+        frame = self.current_frame + 1
+        frame_count = self._frame_count
+        
+        # Закончились кадры?
+        if frame >= frame_count:
+            if self._loop:
+                frame = 0  # Начинаем сначала
+            else:
+                frame = frame_count - 1
+                self.animations[self.current_animation]['finished'] = True
         
-        animation = self.animations[self.current_animation]
+        # Обновляем кадр и изображение спрайта (как _update_image, но без лишнего вызова)
+        self.current_frame = frame
+        self.image = self._frames[frame]
+    
+    def _build_frame_cache(self, animation):
+        """
+        Нарезаем кадры анимации ОДИН РАЗ при добавлении анимации
+        Дальше _update_image только выбирает готовую поверхность из списка
+        """
+        sprite_image = animation['sprite_image']
+        frame_width = animation['frame_width']
+        frame_height = animation['frame_height']
         
-        # Увеличиваем таймер
-        self.animation_timer += 1
+        # Общий кэш только для листов из _IMAGE_CACHE - лист, загруженный до
+        # создания окна, не кэшируется и не должен удерживаться кэшем кадров
+        shared = any(image is sprite_image for image in _IMAGE_CACHE.values())
         
-        # Время сменить кадр?
-        if self.animation_timer >= self.animation_speed:
-            self.animation_timer = 0
-            self.current_frame += 1
-            
-            # Закончились кадры?
-            if self.current_frame >= animation['frames']:
-                if animation['loop']:
-                    self.current_frame = 0  # Начинаем сначала
-                else:
-                    self.current_frame = animation['frames'] - 1
-                    animation['finished'] = True
-        
-        # Обновляем изображение спрайта
-        self._update_image()
+        # Те же кадры того же листа уже нарезаны (например, другим персонажем)?
+        cache_key = (sprite_image, animation['frame_positions'], frame_width, frame_height)
+        cached = _FRAMES_CACHE.get(cache_key) if shared else None
+        if cached is not None:
+            animation['frames_cache'] = cached
+            self._build_scaled_cache(animation)
+            return
+        
+        # Вырезаем каждый кадр
+        sheet_rect = sprite_image.get_rect()
+        frames_cache = []
+        for frame_x, frame_y in animation['frame_positions']:
+            frame_rect = pygame.Rect(frame_x, frame_y, frame_width, frame_height)
+            if sheet_rect.contains(frame_rect):
+                # Подповерхность ссылается на пиксели спрайт-листа - без копирования
+                frame_surface = sprite_image.subsurface(frame_rect)
+            else:
+                # Кадр выходит за край листа - копируем то, что есть, остальное прозрачное
+                # BLEND_RGBA_MAX по нулевой поверхности - точная копия пикселей,
+                # не зависящая от режима смешивания альфа-канала
+                frame_surface = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
+                frame_surface.blit(sprite_image, (0, 0), frame_rect, special_flags=pygame.BLEND_RGBA_MAX)
+                try:
+                    # Копия тоже должна быть в формате экрана, как и сам спрайт-лист
+                    frame_surface = frame_surface.convert_alpha()
+                except pygame.error:
+                    pass
+            frames_cache.append(frame_surface)
+        
+        animation['frames_cache'] = frames_cache
+        if shared:
+            _FRAMES_CACHE[cache_key] = frames_cache
+        self._build_scaled_cache(animation)
     
-    def _update_image(self):
+    def _build_scaled_cache(self, animation):
         """
-        Обновляем изображение спрайта для текущего кадра анимации
+        Готовим масштабированные копии кадров для текущего масштаба
+        Копии делаются только под нужный масштаб: при scale=1.0 обычные кадры -
+        это подповерхности листа без копирования
+        Зеркальные кадры создаются позже, в _select_frames, и только если
+        персонаж AUTO_FLIP действительно повернулся влево
+        Копии принадлежат анимации: новый масштаб заменяет старые, а не копит их
+        """
+        if self.scale != 1.0:
+            new_size = (int(animation['frame_width'] * self.scale), int(animation['frame_height'] * self.scale))
+            scaled = [pygame.transform.scale(s, new_size) for s in animation['frames_cache']]
+        else:
+            scaled = animation['frames_cache']
+        animation['frames_cache_scaled'] = scaled
+        animation['frames_cache_flipped_scaled'] = None
+        animation['cache_scale'] = self.scale
+    
+    def _select_frames(self):
+        """
+        Выбираем готовый список кадров под текущие анимацию, масштаб и направление
+        Вызывается только при их смене, а не каждый кадр игры
         """
         if self.current_animation is None:
             return
         
         animation = self.animations[self.current_animation]
-        sprite_image = animation['sprite_image']
-        frame_width = animation['frame_width']
-        frame_height = animation['frame_height']
-        
-        # Определяем позицию кадра в зависимости от режима
-        if animation['mode'] == 'master' or animation['mode'] == 'range':
-            # Режим большого спрайт-листа или диапазона - используем заранее вычисленные позиции
-            frame_x, frame_y = animation['frame_positions'][self.current_frame]
-        else:
-            # Режим отдельного спрайт-листа - кадры идут слева направо
-            frame_x = self.current_frame * frame_width
-            frame_y = 0
         
-        # Вырезаем кадр
-        frame_rect = (frame_x, frame_y, frame_width, frame_height)
-        frame_surface = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-        frame_surface.blit(sprite_image, (0, 0), frame_rect)
+        # Масштаб поменяли после добавления анимации - перестраиваем кэш
+        if animation['cache_scale'] != self.scale:
+            self._build_scaled_cache(animation)
         
-        # Применяем зеркалирование в зависимости от режима направлений
-        if self.direction_mode == self.AUTO_FLIP and not self.facing_right:
-            # Автоматическое зеркалирование
-            frame_surface = pygame.transform.flip(frame_surface, True, False)
-        elif self.direction_mode == self.NO_FLIP:
-            # Никогда не зеркалим
-            pass
+        # Зеркалим только в режиме AUTO_FLIP при взгляде влево
         # Для SEPARATE_DIRECTIONS зеркалирование не нужно - у нас отдельные спрайты
+        if self.direction_mode == self.AUTO_FLIP and not self.facing_right:
+            flipped = animation['frames_cache_flipped_scaled']
+            if flipped is None:
+                # Первый взгляд влево при этом масштабе - зеркалим кадры один раз
+                flipped = [pygame.transform.flip(s, True, False) for s in animation['frames_cache_scaled']]
+                animation['frames_cache_flipped_scaled'] = flipped
+            self._frames = flipped
+        else:
+            self._frames = animation['frames_cache_scaled']
         
-        # Масштабируем, если нужно
-        if self.scale != 1.0:
-            new_width = int(frame_width * self.scale)
-            new_height = int(frame_height * self.scale)
-            frame_surface = pygame.transform.scale(frame_surface, (new_width, new_height))
+        self._update_image()
+    
+    def _update_image(self):
+        """
+        Обновляем изображение спрайта для текущего кадра анимации
+        """
+        if self.current_animation is None:
+            return
         
-        # Обновляем изображение спрайта
-        self.image = frame_surface
-        self._original_image = frame_surface.copy()
+        # Берём заранее подготовленный кадр
+        self.image = self._frames[self.current_frame]
     
     def move(self, dx, dy):
         """
@@ -363,9 +586,9 @@ class AnimatedCharacter(pygame.sprite.Sprite):
         # Автоматически определяем направление (если не отключено)
         if self.direction_mode != self.NO_FLIP:
             if dx > 0:
-                self.facing_right = True
+                self.set_facing_direction(True)
             elif dx < 0:
-                self.facing_right = False
+                self.set_facing_direction(False)
     
     def set_position(self, x, y):
         """
@@ -450,22 +673,10 @@ class AnimatedCharacter(pygame.sprite.Sprite):
             return False
         
         # Вычисляем позиции выбранных кадров
-        frame_positions = []
+        # (переводим из нумерации "с 1" в нумерацию "с 0")
         frames_count = end_frame - start_frame + 1
-        
-        for i in range(frames_count):
-            # Переводим из нумерации "с 1" в нумерацию "с 0"
-            frame_index = (start_frame - 1) + i
-            
-            # Вычисляем строку и колонку
-            row = frame_index // self.master_columns
-            col = frame_index % self.master_columns
-            
-            # Вычисляем пиксельные координаты
-            x = col * self.master_frame_width
-            y = row * self.master_frame_height
-            
-            frame_positions.append((x, y))
+        frame_positions = _grid_frame_positions(start_frame - 1, frames_count, self.master_columns,
+                                                self.master_frame_width, self.master_frame_height)
         
         self.animations[name] = {
             'mode': 'range',
@@ -474,22 +685,21 @@ class AnimatedCharacter(pygame.sprite.Sprite):
             'frame_height': self.master_frame_height,
             'frames': frames_count,
             'speed': speed,
+            'speed_ms': speed * _FRAME_TIME_MS,
             'loop': loop,
             'finished': False,
             'frame_positions': frame_positions,
             'start_frame': start_frame,
             'end_frame': end_frame
         }
+        self._build_frame_cache(self.animations[name])
         
         # Если это первая анимация, делаем её текущей
         if self.current_animation is None:
-            self.current_animation = name
-            self.animation_speed = speed
-            self.current_frame_width = self.master_frame_width
-            self.current_frame_height = self.master_frame_height
-            self._update_sprite_attributes()
+            self._set_current_animation(name)
         
-        print(f"✅ Добавлена анимация из диапазона: {name} (кадры {start_frame}-{end_frame}, всего {frames_count})")
+        if DEBUG:
+            print(f"✅ Добавлена анимация из диапазона: {name} (кадры {start_frame}-{end_frame}, всего {frames_count})")
         return True
     
     def show_frame_grid(self):
@@ -508,12 +718,13 @@ class AnimatedCharacter(pygame.sprite.Sprite):
         print(f"\n🗂️  СЕТКА КАДРОВ ({total_columns} колонок × {total_rows} строк):")
         print("=" * (total_columns * 5))
         
+        # Собираем всю сетку в одну строку и печатаем разом
+        rows = []
         for row in range(total_rows):
-            line = ""
-            for col in range(total_columns):
-                frame_number = row * total_columns + col + 1  # Нумерация с 1
-                line += f"[{frame_number:2d}]"
-            print(f"Строка {row + 1}: {line}")
+            # Нумерация с 1
+            line = "".join(f"[{row * total_columns + col + 1:2d}]" for col in range(total_columns))
+            rows.append(f"Строка {row + 1}: {line}")
+        print("\n".join(rows))
         
         print("=" * (total_columns * 5))
         print(f"📊 Всего кадров: {total_columns * total_rows}")
@@ -568,6 +779,22 @@ class GameAnimator(pygame.sprite.Group):
         """
         self.add(character)
     
+    def update(self, *args, **kwargs):
+        """
+        Обновляем всех персонажей за один проход
+        Время читается один раз на всю группу, а персонажи, у которых
+        ещё не пора менять кадр, пропускаются без вызова их update()
+        """
+        now = pygame.time.get_ticks()
+        standard_update = AnimatedCharacter.update
+        for sprite in self.sprites():
+            # Быстрый путь только для персонажей со стандартным update()
+            if type(sprite).update is standard_update:
+                if now >= sprite._next_frame_time:
+                    sprite._advance_frame(now)
+            else:
+                sprite.update(*args, **kwargs)
+    
     def update_all(self):
         """
         Обновляем все персонажи (можно использовать стандартный update())
@@ -576,9 +803,24 @@ class GameAnimator(pygame.sprite.Group):
     
     def draw_all(self, screen):
         """
-        Рисуем всех персонажей (можно использовать стандартный draw())
+        Рисуем всех персонажей (совместимо с Group.clear())
+        В pygame стандартный draw() уже рисует всю группу одним вызовом blits(),
+        в pygame-ce используем более быстрый fblits()
         """
-        self.draw(screen)  # Стандартный метод pygame.sprite.Group
+        fblits = getattr(screen, 'fblits', None)
+        if fblits is None:
+            return self.draw(screen)  # Стандартный метод pygame.sprite.Group
+        
+        sprites = self.sprites()
+        fblits([(sprite.image, sprite.rect) for sprite in sprites])
+        
+        # fblits не возвращает прямоугольники - запоминаем их сами, как это делает draw(),
+        # иначе Group.clear() не сможет стереть спрайты с прошлого кадра
+        clip = screen.get_clip()
+        for sprite in sprites:
+            self.spritedict[sprite] = pygame.Rect(sprite.rect.topleft, sprite.image.get_size()).clip(clip)
+        self.lostsprites = []
+        return []
 
 
 # Функции-помощники для быстрого создания персонажей
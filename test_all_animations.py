@@ -1,12 +1,14 @@
 import pygame
 from game_animator import AnimatedCharacter
+from test_utils import get_font
 
 # Инициализация Pygame
 pygame.init()
-screen = pygame.display.set_mode((1000, 700))
+# vsync - кадры выводятся синхронно с обновлением экрана (SCALED нужен для vsync)
+screen = pygame.display.set_mode((1000, 700), pygame.SCALED, vsync=1)
 pygame.display.set_caption("Тест всех анимаций - нажимайте цифры!")
 
-# Создаём героя
+# Создаём героя (кадры масштабируются в 3 раза один раз при добавлении анимации)
 hero = AnimatedCharacter(x=500, y=350, scale=3.0)
 
 # Загружаем спрайт-лист
@@ -76,6 +78,31 @@ animations = {
     pygame.K_e: "stand"
 }
 
+# Шрифты и надписи создаём один раз, а не в каждом кадре
+font = get_font(42)
+font_small = get_font(24)
+controls = [
+    "1-Stance  2-Run  3-Swing  4-Block  5-Hit&Die",
+    "6-Cast  7-Shoot  8-Walk  9-Duck  0-Jump",
+    "Q-StairsUp  W-StairsDown  E-Stand"
+]
+control_blits = [
+    (font_small.render(control, True, (200, 200, 200)), (10, 60 + i * 25))
+    for i, control in enumerate(controls)
+]
+
+# Надпись с текущей анимацией перерисовываем только при смене анимации
+text_animation = None
+text_surface = None
+TEXT_POS = pygame.Rect(10, 10, 0, 0)
+
+# Серый фон - готовая поверхность, чтобы весь кадр рисовался одним вызовом blits()
+background = pygame.Surface(screen.get_size()).convert()
+background.fill((64, 64, 64))
+
+# Что было нарисовано в прошлый раз - если ничего не поменялось, экран не перерисовываем
+prev_image = None
+
 # Основной цикл
 clock = pygame.time.Clock()
 running = True
@@ -95,6 +122,10 @@ print("Q - Stairs up (вверх по лестнице)")
 print("W - Stairs down (вниз по лестнице)")
 print("E - Stand (стоять)")
 
+# Нужны только закрытие окна и нажатия клавиш - остальные события SDL даже не кладёт в очередь
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
 while running:
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
@@ -106,28 +137,22 @@ while running:
 
     hero.update()
     
-    screen.fill((64, 64, 64))  # Серый фон
-    screen.blit(hero.image, hero.rect)
+    # Кадр анимации и надпись не сменились - перерисовывать нечего
+    if hero.image is prev_image and text_animation == current_animation:
+        clock.tick(120)
+        continue
+    prev_image = hero.image
     
     # Показываем информацию
-    font = pygame.font.Font(None, 42)
-    text = f"Текущая анимация: {current_animation.upper()}"
-    text_surface = font.render(text, True, (255, 255, 255))
-    screen.blit(text_surface, (10, 10))
-    
-    # Показываем управление
-    font_small = pygame.font.Font(None, 24)
-    controls = [
-        "1-Stance  2-Run  3-Swing  4-Block  5-Hit&Die",
-        "6-Cast  7-Shoot  8-Walk  9-Duck  0-Jump",
-        "Q-StairsUp  W-StairsDown  E-Stand"
-    ]
+    if text_animation != current_animation:
+        text = f"Текущая анимация: {current_animation.upper()}"
+        text_surface = font.render(text, True, (255, 255, 255))
+        text_animation = current_animation
     
-    for i, control in enumerate(controls):
-        control_surface = font_small.render(control, True, (200, 200, 200))
-        screen.blit(control_surface, (10, 60 + i * 25))
+    # Рисуем фон, героя, информацию и управление одним вызовом
+    screen.blits([(background, (0, 0)), (hero.image, hero.rect), (text_surface, TEXT_POS)] + control_blits, doreturn=0)
     
     pygame.display.flip()
-    clock.tick(60)
+    clock.tick(120)  # Темп задаёт vsync, это лишь верхний предел
 
 pygame.quit() 
\ No newline at end of file
@@ -0,0 +1,127 @@
+import sys
+
+import pygame
+from game_animator import AnimatedCharacter
+from test_utils import get_font
+
+# Все проверяемые анимации в одном месте:
+# имя -> (первый кадр, последний кадр, скорость, цвет фона, размер шрифта, надпись, заголовок окна)
+ANIMS = {
+    "stance": (1, 4, 20, (50, 50, 100), 48,  # Тёмно-синий фон
+               "STANCE (Стойка) - кадры 1-4", "Stance (Стойка)"),
+    "run": (5, 12, 8, (34, 139, 34), 48,  # Зелёный фон
+            "RUN (Бег) - кадры 5-12", "Run (Бег)"),
+    "swing": (13, 16, 12, (200, 50, 50), 42,  # Красный фон
+              "SWING WEAPON (Удар оружием) - кадры 13-16", "Swing Weapon (Удар оружием)"),
+    "walk": (33, 40, 12, (100, 149, 237), 48,  # Синий фон
+             "WALK (Ходьба) - кадры 33-40", "Walk (Ходьба)"),
+    "jump": (43, 48, 10, (255, 165, 0), 42,  # Оранжевый фон
+             "JUMP AND FALL (Прыжок) - кадры 43-48", "Jump and Fall (Прыжок)"),
+}
+
+
+def build_background(screen, color, font_size, text):
+    """
+    Фон с надписью для анимации - заливаем и рисуем текст один раз
+    """
+    text_surface = get_font(font_size).render(text, True, (255, 255, 255))
+
+    background = pygame.Surface(screen.get_size()).convert()
+    background.fill(color)
+    background.blit(text_surface, (10, 10))
+    return background
+
+
+def main(names=None):
+    """
+    Показываем анимации из ANIMS в одном окне
+    names - какие анимации показать (по умолчанию все), ПРОБЕЛ - следующая
+
+    Pygame, окно и спрайт-лист инициализируются один раз на все анимации
+    """
+    names = list(names or ANIMS)
+    unknown = [name for name in names if name not in ANIMS]
+    if unknown:
+        print(f"❌ Неизвестная анимация: {', '.join(unknown)}. Доступны: {', '.join(ANIMS)}")
+        return
+
+    # Инициализация Pygame
+    pygame.init()
+    # vsync - кадры выводятся синхронно с обновлением экрана (SCALED нужен для vsync)
+    # С SCALED кадр выводится на экран целиком даже в display.update(rect),
+    # поэтому перерисовка только области героя экономит лишь рисование в буфер окна
+    screen = pygame.display.set_mode((800, 600), pygame.SCALED, vsync=1)
+
+    # Создаём героя (кадры масштабируются в 3 раза один раз при добавлении анимации)
+    hero = AnimatedCharacter(x=400, y=300, scale=3.0)
+
+    # Загружаем спрайт-лист один раз для всех анимаций
+    hero.load_master_sprite_sheet("platformer_sprites_base.png", frame_width=64, frame_height=64)
+
+    # Добавляем анимации и заранее готовим для каждой фон с надписью
+    backgrounds = {}
+    for name in names:
+        start_frame, end_frame, speed, color, font_size, text, _ = ANIMS[name]
+        hero.add_animation_from_range(name, start_frame, end_frame, speed=speed)
+        backgrounds[name] = build_background(screen, color, font_size, text)
+
+    if len(names) > 1:
+        print("\n🎮 ПРОБЕЛ - следующая анимация")
+
+    # Нужны только закрытие окна и нажатия клавиш - остальные события SDL даже не кладёт в очередь
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
+    # Прямоугольники для перерисовки создаём один раз и дальше меняем на месте
+    prev_rect = hero.rect.copy()
+    dirty_rect = hero.rect.copy()
+
+    # Основной цикл
+    clock = pygame.time.Clock()
+    running = True
+    index = 0
+    switched = True
+
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                index = (index + 1) % len(names)
+                switched = True
+
+        if switched:
+            # Новая анимация: меняем заголовок и выводим её фон целиком
+            name = names[index]
+            pygame.display.set_caption(f"Тест анимации: {ANIMS[name][6]}")
+            hero.play_animation(name)
+            background = backgrounds[name]
+            screen.blit(background, (0, 0))
+            pygame.display.flip()
+            prev_rect.update(hero.rect)
+            prev_image = None
+            switched = False
+
+        hero.update()
+
+        # Кадр анимации не сменился (та же поверхность на том же месте) - перерисовывать нечего
+        if hero.image is prev_image and hero.rect == prev_rect:
+            clock.tick(120)
+            continue
+
+        # Стираем героя фоном и перерисовываем в буфере окна только его область (одним вызовом)
+        screen.blits(((background, prev_rect, prev_rect), (hero.image, hero.rect)), doreturn=0)
+
+        dirty_rect.update(prev_rect)
+        dirty_rect.union_ip(hero.rect)
+        pygame.display.update(dirty_rect)
+        prev_rect.update(hero.rect)
+        prev_image = hero.image
+        clock.tick(120)  # Темп задаёт vsync, это лишь верхний предел
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    # python test_animations.py [имя ...] - например: python test_animations.py run jump
+    main(sys.argv[1:])
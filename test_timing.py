@@ -0,0 +1,62 @@
+import os
+
+# Окно не нужно - проверяем только отсчёт времени
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from game_animator import AnimatedCharacter
+
+
+def count_frame_changes(speed, fps, seconds=10, new_speed=None):
+    """
+    Гоняем update() с поддельными часами и считаем смены кадра
+    Часы идут целыми миллисекундами, как pygame.time.get_ticks()
+    new_speed - поменять animation_speed уже запущенной анимации
+    """
+    clock = {"now": 0}
+    real_get_ticks = pygame.time.get_ticks
+    pygame.time.get_ticks = lambda: clock["now"]
+    try:
+        hero = AnimatedCharacter()
+        hero.load_master_sprite_sheet("platformer_sprites_base.png", frame_width=64, frame_height=64)
+        hero.add_animation_from_range("run", 1, 8, speed=speed)
+        if new_speed is not None:
+            hero.animation_speed = new_speed
+
+        changes = 0
+        last_image = hero.image
+        for tick in range(1, fps * seconds + 1):
+            clock["now"] = tick * 1000 // fps
+            hero.update()
+            if hero.image is not last_image:
+                changes += 1
+                last_image = hero.image
+        return changes
+    finally:
+        pygame.time.get_ticks = real_get_ticks
+
+
+def test_frame_rate_matches_speed():
+    """
+    Кадров в секунду должно быть 60 / speed при любом FPS игры
+    (но не больше одной смены за кадр игры)
+    """
+    for speed in (1, 2, 3, 4, 8, 10, 12, 20):
+        for fps in (30, 60, 144):
+            expected = 10 * min(60 / speed, fps)
+            changes = count_frame_changes(speed, fps)
+            assert abs(changes - expected) <= 1, (speed, fps, changes, expected)
+
+
+def test_animation_speed_changes_running_animation():
+    """
+    hero.animation_speed = ... меняет скорость уже играющей анимации
+    """
+    changes = count_frame_changes(20, 60, new_speed=5)
+    assert abs(changes - 10 * 60 / 5) <= 1, changes
+
+
+if __name__ == "__main__":
+    test_frame_rate_matches_speed()
+    test_animation_speed_changes_running_animation()
+    print("✅ Скорость анимации совпадает с 60 / speed при 30, 60 и 144 FPS")
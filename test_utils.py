@@ -0,0 +1,16 @@
+import pygame
+
+# Загруженные шрифты: размер -> pygame.font.Font
+# Шрифт по умолчанию открывается один раз на каждый размер
+_FONTS = {}
+
+
+def get_font(size):
+    """
+    Получаем шрифт по умолчанию нужного размера (из кэша)
+    """
+    font = _FONTS.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        _FONTS[size] = font
+    return font